@@ -32,9 +32,153 @@ from pants.engine.target import Target
 from pants.testutil.rule_runner import RuleRunner, engine_error
 
 
-@pytest.fixture()
-def rule_runner() -> RuleRunner:
-    rule_runner = RuleRunner(
+SIMPLE_GO_MOD = dedent(
+    """\
+    module foo.example.com
+    go 1.17
+    """
+).encode()
+
+SIMPLE_MAIN_GO = dedent(
+    """\
+    package main
+
+    import (
+        "fmt"
+    )
+
+    func main() {
+        fmt.Println("Hello world!")
+    }
+    """
+).encode()
+
+BINARY_BUILD = dedent(
+    """\
+    go_mod(name='mod')
+    go_package(name='pkg')
+    go_binary(name='bin')
+    """
+).encode()
+
+THIRD_PARTY_IMPORT_PATH = "pantsbuild.org/go-sample-for-test"
+THIRD_PARTY_VERSION = "v0.0.1"
+
+THIRD_PARTY_MODULE_FILES = (
+    (
+        "pkg/hello/hello.go",
+        dedent(
+            """\
+            package hello
+            import "fmt"
+
+
+            func Hello() {
+                fmt.Println("Hello world!")
+            }
+            """
+        ),
+    ),
+    (
+        "cmd/hello/main.go",
+        dedent(
+            f"""\
+            package main
+            import "{THIRD_PARTY_IMPORT_PATH}/pkg/hello"
+
+
+            func main() {{
+                hello.Hello()
+            }}
+            """
+        ),
+    ),
+)
+
+THIRD_PARTY_BUILD_TEMPLATE = dedent(
+    """\
+    go_mod(name='mod')
+    go_binary(name="bin", main='//:mod#{import_path}/{main_pkg}')
+    """
+)
+
+THIRD_PARTY_GO_MOD = dedent(
+    f"""\
+    module go.example.com/foo
+    go 1.16
+
+    require (
+    \t{THIRD_PARTY_IMPORT_PATH} {THIRD_PARTY_VERSION}
+    )
+    """
+).encode()
+
+WITH_DEPS_LIB_GO = dedent(
+    """\
+    package lib
+
+    import (
+        "fmt"
+        "rsc.io/quote"
+    )
+
+    func Quote(s string) string {
+        return fmt.Sprintf(">> %s <<", s)
+    }
+
+    func GoProverb() string {
+        return quote.Go()
+    }
+    """
+).encode()
+
+WITH_DEPS_MAIN_GO = dedent(
+    """\
+    package main
+
+    import (
+        "fmt"
+        "foo.example.com/lib"
+    )
+
+    func main() {
+        fmt.Println(lib.Quote("Hello world!"))
+        fmt.Println(lib.GoProverb())
+    }
+    """
+).encode()
+
+WITH_DEPS_GO_MOD = dedent(
+    """\
+    module foo.example.com
+    go 1.17
+    require (
+        golang.org/x/text v0.0.0-20170915032832-14c0d48ead0c // indirect
+        rsc.io/quote v1.5.2
+        rsc.io/sampler v1.3.0 // indirect
+    )
+    """
+).encode()
+
+WITH_DEPS_GO_SUM = dedent(
+    """\
+    golang.org/x/text v0.0.0-20170915032832-14c0d48ead0c h1:qgOY6WgZOaTkIIMiVjBQcw93ERBE4m30iBm00nkL0i8=
+    golang.org/x/text v0.0.0-20170915032832-14c0d48ead0c/go.mod h1:NqM8EUOU14njkJ3fqMW+pc6Ldnwhi/IjpwHt7yyuwOQ=
+    rsc.io/quote v1.5.2 h1:w5fcysjrx7yqtD/aO+QwRjYZOKnaM9Uh2b40tElTs3Y=
+    rsc.io/quote v1.5.2/go.mod h1:LzX7hefJvL54yjefDEDHNONDjII0t9xZLPXsUe+TKr0=
+    rsc.io/sampler v1.3.0 h1:7uVkIFmeBqHfdjD+gZwtXXI+RODJ2Wc4O7MPEh/QiW4=
+    rsc.io/sampler v1.3.0/go.mod h1:T1hPZKmBbMNahiBKFy5HrXp6adAjACjK9JXDnKaTXpA=
+    """
+).encode()
+
+
+@pytest.fixture(scope="module")
+def module_rule_runner() -> RuleRunner:
+    # NB: This intentionally does not pass `isolated_local_store=True`: the Go SDK is discovered
+    # from the `PATH` (not downloaded), and compiled stdlib packages and `go mod download` results
+    # come out of the process cache in the shared local store. Do not point `GOMODCACHE` outside
+    # the sandbox, since downloaded modules are captured from the sandbox `gopath`.
+    return RuleRunner(
         rules=[
             *assembly.rules(),
             *import_analysis.rules(),
@@ -55,8 +199,17 @@ def rule_runner() -> RuleRunner:
             GoPackageTarget,
         ],
     )
-    rule_runner.set_options([], env_inherit={"PATH"})
-    return rule_runner
+
+
+@pytest.fixture
+def rule_runner(module_rule_runner: RuleRunner) -> RuleRunner:
+    """Reset the module-scoped `RuleRunner` so that each test starts from an empty build root.
+
+    Sharing the `RuleRunner` across the module means the rule graph and scheduler are built once
+    rather than per test; only the workspace and options are reset.
+    """
+    module_rule_runner.reset_workspace(env_inherit={"PATH"})
+    return module_rule_runner
 
 
 def build_package(rule_runner: RuleRunner, binary_target: Target) -> BuiltPackage:
@@ -66,109 +219,19 @@ def build_package(rule_runner: RuleRunner, binary_target: Target) -> BuiltPackag
     return result
 
 
-def test_package_simple(rule_runner: RuleRunner) -> None:
+def setup_third_party_binary(rule_runner: RuleRunner, *, main_pkg: str) -> None:
+    """Write a `go_binary` whose `main` is `main_pkg` within a module served by a local proxy."""
     rule_runner.write_files(
         {
-            "go.mod": dedent(
-                """\
-                module foo.example.com
-                go 1.17
-                """
-            ),
-            "main.go": dedent(
-                """\
-                package main
-
-                import (
-                    "fmt"
-                )
-
-                func main() {
-                    fmt.Println("Hello world!")
-                }
-                """
-            ),
-            "BUILD": dedent(
-                """\
-                go_mod(name='mod')
-                go_package(name='pkg')
-                go_binary(name='bin')
-                """
-            ),
-        }
-    )
-    binary_tgt = rule_runner.get_target(Address("", target_name="bin"))
-    built_package = build_package(rule_runner, binary_tgt)
-    assert len(built_package.artifacts) == 1
-    assert built_package.artifacts[0].relpath == "bin"
-
-    result = subprocess.run([os.path.join(rule_runner.build_root, "bin")], stdout=subprocess.PIPE)
-    assert result.returncode == 0
-    assert result.stdout == b"Hello world!\n"
-
-
-def test_package_third_party_requires_main(rule_runner: RuleRunner) -> None:
-    import_path = "pantsbuild.org/go-sample-for-test"
-    version = "v0.0.1"
-
-    fake_gomod = gen_module_gomodproxy(
-        version,
-        import_path,
-        (
-            (
-                "pkg/hello/hello.go",
-                dedent(
-                    """\
-        package hello
-        import "fmt"
-
-
-        func Hello() {
-            fmt.Println("Hello world!")
-        }
-        """
-                ),
-            ),
-            (
-                "cmd/hello/main.go",
-                dedent(
-                    f"""\
-        package main
-        import "{import_path}/pkg/hello"
-
-
-        func main() {{
-            hello.Hello()
-        }}
-        """
-                ),
-            ),
-        ),
-    )
-
-    fake_gomod.update(
-        {
-            "BUILD": dedent(
-                f"""\
-                go_mod(name='mod')
-                go_binary(name="bin", main='//:mod#{import_path}/pkg/hello')
-                """
+            **gen_module_gomodproxy(
+                THIRD_PARTY_VERSION, THIRD_PARTY_IMPORT_PATH, THIRD_PARTY_MODULE_FILES
             ),
-            "go.mod": dedent(
-                f"""\
-                module go.example.com/foo
-                go 1.16
-
-                require (
-                \t{import_path} {version}
-                )
-                """
+            "BUILD": THIRD_PARTY_BUILD_TEMPLATE.format(
+                import_path=THIRD_PARTY_IMPORT_PATH, main_pkg=main_pkg
             ),
+            "go.mod": THIRD_PARTY_GO_MOD,
         }
     )
-
-    rule_runner.write_files(fake_gomod)
-
     rule_runner.set_options(
         [
             "--go-test-args=-v -bench=.",
@@ -178,157 +241,63 @@ def test_package_third_party_requires_main(rule_runner: RuleRunner) -> None:
         env_inherit={"PATH"},
     )
 
-    binary_tgt = rule_runner.get_target(Address("", target_name="bin"))
-    with engine_error(ValueError, contains="but uses package name `hello` instead of `main`"):
-        build_package(rule_runner, binary_tgt)
-
 
-def test_package_third_party_can_run(rule_runner: RuleRunner) -> None:
-    import_path = "pantsbuild.org/go-sample-for-test"
-    version = "v0.0.1"
-
-    fake_gomod = gen_module_gomodproxy(
-        version,
-        import_path,
-        (
-            (
-                "pkg/hello/hello.go",
-                dedent(
-                    """\
-        package hello
-        import "fmt"
-
-
-        func Hello() {
-            fmt.Println("Hello world!")
+def test_package_simple(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "go.mod": SIMPLE_GO_MOD,
+            "main.go": SIMPLE_MAIN_GO,
+            "BUILD": BINARY_BUILD,
         }
-        """
-                ),
-            ),
-            (
-                "cmd/hello/main.go",
-                dedent(
-                    f"""\
-        package main
-        import "{import_path}/pkg/hello"
-
-
-        func main() {{
-            hello.Hello()
-        }}
-        """
-                ),
-            ),
-        ),
     )
+    binary_tgt = rule_runner.get_target(Address("", target_name="bin"))
+    built_package = build_package(rule_runner, binary_tgt)
+    assert len(built_package.artifacts) == 1
+    assert built_package.artifacts[0].relpath == "bin"
 
-    fake_gomod.update(
-        {
-            "BUILD": dedent(
-                f"""\
-                go_mod(name='mod')
-                go_binary(name="bin", main='//:mod#{import_path}/cmd/hello')
-                """
-            ),
-            "go.mod": dedent(
-                f"""\
-                module go.example.com/foo
-                go 1.16
-
-                require (
-                \t{import_path} {version}
-                )
-                """
-            ),
-        }
+    result = subprocess.run(
+        [os.path.join(rule_runner.build_root, "bin")],
+        stdout=subprocess.PIPE,
+        check=True,
+        timeout=30,
     )
+    assert result.stdout == b"Hello world!\n"
 
-    rule_runner.write_files(fake_gomod)
 
-    rule_runner.set_options(
-        [
-            "--go-test-args=-v -bench=.",
-            f"--golang-subprocess-env-vars=GOPROXY=file://{rule_runner.build_root}/go-mod-proxy",
-            "--golang-subprocess-env-vars=GOSUMDB=off",
-        ],
-        env_inherit={"PATH"},
-    )
+def test_package_third_party_requires_main(rule_runner: RuleRunner) -> None:
+    setup_third_party_binary(rule_runner, main_pkg="pkg/hello")
+
+    binary_tgt = rule_runner.get_target(Address("", target_name="bin"))
+    with engine_error(ValueError, contains="but uses package name `hello` instead of `main`"):
+        build_package(rule_runner, binary_tgt)
+
+
+def test_package_third_party_can_run(rule_runner: RuleRunner) -> None:
+    setup_third_party_binary(rule_runner, main_pkg="cmd/hello")
 
     binary_tgt = rule_runner.get_target(Address("", target_name="bin"))
     built_package = build_package(rule_runner, binary_tgt)
     assert len(built_package.artifacts) == 1
     assert built_package.artifacts[0].relpath == "bin"
 
-    result = subprocess.run([os.path.join(rule_runner.build_root, "bin")], stdout=subprocess.PIPE)
-    assert result.returncode == 0
+    result = subprocess.run(
+        [os.path.join(rule_runner.build_root, "bin")],
+        stdout=subprocess.PIPE,
+        check=True,
+        timeout=30,
+    )
     assert result.stdout == b"Hello world!\n"
 
 
 def test_package_with_dependencies(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
-            "lib/lib.go": dedent(
-                """\
-                package lib
-
-                import (
-                    "fmt"
-                    "rsc.io/quote"
-                )
-
-                func Quote(s string) string {
-                    return fmt.Sprintf(">> %s <<", s)
-                }
-
-                func GoProverb() string {
-                    return quote.Go()
-                }
-                """
-            ),
-            "lib/BUILD": "go_package()",
-            "main.go": dedent(
-                """\
-                package main
-
-                import (
-                    "fmt"
-                    "foo.example.com/lib"
-                )
-
-                func main() {
-                    fmt.Println(lib.Quote("Hello world!"))
-                    fmt.Println(lib.GoProverb())
-                }
-                """
-            ),
-            "go.mod": dedent(
-                """\
-                module foo.example.com
-                go 1.17
-                require (
-                    golang.org/x/text v0.0.0-20170915032832-14c0d48ead0c // indirect
-                    rsc.io/quote v1.5.2
-                    rsc.io/sampler v1.3.0 // indirect
-                )
-                """
-            ),
-            "go.sum": dedent(
-                """\
-                golang.org/x/text v0.0.0-20170915032832-14c0d48ead0c h1:qgOY6WgZOaTkIIMiVjBQcw93ERBE4m30iBm00nkL0i8=
-                golang.org/x/text v0.0.0-20170915032832-14c0d48ead0c/go.mod h1:NqM8EUOU14njkJ3fqMW+pc6Ldnwhi/IjpwHt7yyuwOQ=
-                rsc.io/quote v1.5.2 h1:w5fcysjrx7yqtD/aO+QwRjYZOKnaM9Uh2b40tElTs3Y=
-                rsc.io/quote v1.5.2/go.mod h1:LzX7hefJvL54yjefDEDHNONDjII0t9xZLPXsUe+TKr0=
-                rsc.io/sampler v1.3.0 h1:7uVkIFmeBqHfdjD+gZwtXXI+RODJ2Wc4O7MPEh/QiW4=
-                rsc.io/sampler v1.3.0/go.mod h1:T1hPZKmBbMNahiBKFy5HrXp6adAjACjK9JXDnKaTXpA=
-                """
-            ),
-            "BUILD": dedent(
-                """\
-                go_mod(name='mod')
-                go_package(name='pkg')
-                go_binary(name='bin')
-                """
-            ),
+            "lib/lib.go": WITH_DEPS_LIB_GO,
+            "lib/BUILD": b"go_package()",
+            "main.go": WITH_DEPS_MAIN_GO,
+            "go.mod": WITH_DEPS_GO_MOD,
+            "go.sum": WITH_DEPS_GO_SUM,
+            "BUILD": BINARY_BUILD,
         }
     )
     binary_tgt = rule_runner.get_target(Address("", target_name="bin"))
@@ -336,8 +305,12 @@ def test_package_with_dependencies(rule_runner: RuleRunner) -> None:
     assert len(built_package.artifacts) == 1
     assert built_package.artifacts[0].relpath == "bin"
 
-    result = subprocess.run([os.path.join(rule_runner.build_root, "bin")], stdout=subprocess.PIPE)
-    assert result.returncode == 0
+    result = subprocess.run(
+        [os.path.join(rule_runner.build_root, "bin")],
+        stdout=subprocess.PIPE,
+        check=True,
+        timeout=30,
+    )
     assert result.stdout == (
         b">> Hello world! <<\n"
         b"Don't communicate by sharing memory, share memory by communicating.\n"
@@ -8,27 +8,38 @@ import hashlib
 import io
 import json
 import zipfile
+from functools import lru_cache
 from textwrap import dedent  # noqa: PNT20
 from typing import Dict, Iterable, Tuple
 
 
 # Implements hashing algorithm from https://cs.opensource.google/go/x/mod/+/refs/tags/v0.5.0:sumdb/dirhash/hash.go.
-def compute_module_hash(files: Iterable[Tuple[str, str]]) -> str:
+def compute_module_hash(files: Iterable[Tuple[str, str | bytes]]) -> str:
     """Compute a module hash that can be used in go.sum for an emulated remote package."""
     sorted_files = sorted(files, key=lambda x: x[0])
-    summary = ""
+    summary = hashlib.sha256()
     for name, content in sorted_files:
-        h = hashlib.sha256(content.encode())
-        summary += f"{h.hexdigest()}  {name}\n"
+        content_bytes = content.encode() if isinstance(content, str) else content
+        h = hashlib.sha256(content_bytes)
+        summary.update(f"{h.hexdigest()}  {name}\n".encode())
 
-    h = hashlib.sha256(summary.encode())
-    summary_digest = base64.standard_b64encode(h.digest()).decode()
+    summary_digest = base64.standard_b64encode(summary.digest()).decode()
     return f"h1:{summary_digest}"
 
 
 def gen_module_gomodproxy(
     version: str, import_path: str, files: Iterable[Tuple[str, str]]
 ) -> Dict[str, str | bytes]:
+    # Callers commonly `update()` the result with their own files, so hand out a fresh dict.
+    return dict(
+        _gen_module_gomodproxy(version, import_path, tuple((p, c) for p, c in files))
+    )
+
+
+@lru_cache(maxsize=32)
+def _gen_module_gomodproxy(
+    version: str, import_path: str, files: Tuple[Tuple[str, str], ...]
+) -> Tuple[Tuple[str, str | bytes], ...]:
     go_mod_content = dedent(
         f"""\
         module {import_path}
@@ -39,17 +50,23 @@ def gen_module_gomodproxy(
     go_mod_sum = compute_module_hash([("go.mod", go_mod_content)])
     prefix = f"{import_path}@{version}"
 
-    all_files = [(f"{prefix}/go.mod", go_mod_content)]
-    all_files.extend((f"{prefix}/{path}", contents) for (path, contents) in files)
+    all_files = [(f"{prefix}/go.mod", go_mod_content.encode())]
+    all_files.extend((f"{prefix}/{path}", contents.encode()) for (path, contents) in files)
 
     mod_zip_bytes = io.BytesIO()
     with zipfile.ZipFile(mod_zip_bytes, "w") as mod_zip:
         for name, content in all_files:
-            mod_zip.writestr(name, content)
+            # A fixed timestamp keeps the zip bytes reproducible.
+            zip_info = zipfile.ZipInfo(filename=name, date_time=(2022, 1, 1, 0, 0, 0))
+            # `writestr` ignores the `ZipFile`'s compression for a `ZipInfo`, so set it here.
+            zip_info.compress_type = zipfile.ZIP_STORED
+            # Match the `0o600` mode that `writestr(name, ...)` gives entries.
+            zip_info.external_attr = 0o600 << 16
+            mod_zip.writestr(zip_info, content)
 
     mod_zip_sum = compute_module_hash(all_files)
 
-    return {
+    proxy_files: Dict[str, str | bytes] = {
         "go.sum": dedent(
             f"""\
                 {import_path} {version} {mod_zip_sum}
@@ -68,3 +85,4 @@ def gen_module_gomodproxy(
         f"go-mod-proxy/{import_path}/@v/{version}.mod": go_mod_content,
         f"go-mod-proxy/{import_path}/@v/{version}.zip": mod_zip_bytes.getvalue(),
     }
+    return tuple(proxy_files.items())
@@ -11,20 +11,42 @@ from pants.testutil.rule_runner import RuleRunner, engine_error
 from pants.version import PANTS_SEMVER
 
 
-def test_get_with_version():
-    rule_runner = RuleRunner(aliases=[register.build_file_aliases()], target_types=[GenericTarget])
+VERSIONED_TARGET_NAME = f"test{PANTS_SEMVER}"
 
+VERSIONED_TARGET_BUILD = dedent(
+    """\
+    target(name=f'test{PANTS_VERSION}')
+    """
+)
+
+CONDITIONAL_TARGET_BUILD_TEMPLATE = dedent(
+    """\
+    if PANTS_VERSION {comparator} "{comparand}":
+        target(name=f'test{{PANTS_VERSION}}')
+    """
+)
+
+
+@pytest.fixture(scope="module")
+def module_rule_runner() -> RuleRunner:
+    return RuleRunner(aliases=[register.build_file_aliases()], target_types=[GenericTarget])
+
+
+@pytest.fixture
+def rule_runner(module_rule_runner: RuleRunner) -> RuleRunner:
+    """Share the `RuleRunner` across the module rather than rebuilding it for each case."""
+    module_rule_runner.reset_workspace()
+    return module_rule_runner
+
+
+def test_get_with_version(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
-            "BUILD": dedent(
-                """\
-                target(name=f'test{PANTS_VERSION}')
-                """
-            ),
+            "BUILD": VERSIONED_TARGET_BUILD,
         }
     )
 
-    tgt = rule_runner.get_target(Address("", target_name=f"test{PANTS_SEMVER}"))
+    tgt = rule_runner.get_target(Address("", target_name=VERSIONED_TARGET_NAME))
     assert tgt is not None
 
 
@@ -42,21 +64,16 @@ def test_get_with_version():
         ("!=", "1.0"),
     ],
 )
-def test_get_version_comparable(comparator, comparand):
-    rule_runner = RuleRunner(aliases=[register.build_file_aliases()], target_types=[GenericTarget])
-
+def test_get_version_comparable(rule_runner: RuleRunner, comparator, comparand) -> None:
     rule_runner.write_files(
         {
-            "BUILD": dedent(
-                f"""\
-                if PANTS_VERSION {comparator} "{comparand}":
-                    target(name=f'test{{PANTS_VERSION}}')
-                """
+            "BUILD": CONDITIONAL_TARGET_BUILD_TEMPLATE.format(
+                comparator=comparator, comparand=comparand
             ),
         }
     )
 
-    tgt = rule_runner.get_target(Address("", target_name=f"test{PANTS_SEMVER}"))
+    tgt = rule_runner.get_target(Address("", target_name=VERSIONED_TARGET_NAME))
     assert tgt is not None
 
 
@@ -71,19 +88,14 @@ def test_get_version_comparable(comparator, comparand):
         ("!=", str(PANTS_SEMVER)),
     ],
 )
-def test_get_version_not_comparable(comparator, comparand):
-    rule_runner = RuleRunner(aliases=[register.build_file_aliases()], target_types=[GenericTarget])
-
+def test_get_version_not_comparable(rule_runner: RuleRunner, comparator, comparand) -> None:
     rule_runner.write_files(
         {
-            "BUILD": dedent(
-                f"""\
-                if PANTS_VERSION {comparator} "{comparand}":
-                    target(name=f'test{{PANTS_VERSION}}')
-                """
+            "BUILD": CONDITIONAL_TARGET_BUILD_TEMPLATE.format(
+                comparator=comparator, comparand=comparand
             ),
         }
     )
 
     with engine_error(ResolveError):
-        rule_runner.get_target(Address("", target_name=f"test{PANTS_SEMVER}"))
+        rule_runner.get_target(Address("", target_name=VERSIONED_TARGET_NAME))
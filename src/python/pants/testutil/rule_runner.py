@@ -65,7 +65,14 @@ from pants.source import source_root
 from pants.testutil.option_util import create_options_bootstrapper
 from pants.util.collections import assert_single_element
 from pants.util.contextutil import pushd, temporary_dir, temporary_file
-from pants.util.dirutil import recursive_dirname, safe_mkdir, safe_mkdtemp, safe_open
+from pants.util.dirutil import (
+    recursive_dirname,
+    safe_delete,
+    safe_mkdir,
+    safe_mkdtemp,
+    safe_open,
+    safe_rmtree,
+)
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import OrderedSet
 from pants.util.strutil import softwrap
@@ -555,6 +562,45 @@ class RuleRunner:
                 return bytes(fp.read())
             return str(fp.read())
 
+    def reset_workspace(self, *, env_inherit: set[str] | None = None) -> None:
+        """Remove everything written to the build root and reset options to their defaults.
+
+        :API: public
+
+        This allows one `RuleRunner` to be shared across tests (e.g. via a module-scoped fixture)
+        without rebuilding the rule graph for each of them. Only the `pants_workdir` is preserved.
+
+        env_inherit: Environment variables to inherit from the test runner, as for `set_options`.
+        """
+        workdir = os.path.relpath(self.pants_workdir, self.build_root)
+        workdir_ancestors = set(recursive_dirname(workdir))
+        to_remove = []
+        removed_paths = []
+        for dirpath, dirnames, filenames in os.walk(self.build_root):
+            reldir = os.path.relpath(dirpath, self.build_root)
+            reldir = "" if reldir == os.curdir else reldir
+            if reldir in workdir_ancestors:
+                to_remove.extend(
+                    os.path.join(reldir, name)
+                    for name in (*dirnames, *filenames)
+                    if os.path.join(reldir, name) not in workdir_ancestors
+                )
+            else:
+                removed_paths.extend(os.path.join(reldir, name) for name in (*dirnames, *filenames))
+            dirnames[:] = [d for d in dirnames if os.path.join(reldir, d) != workdir]
+
+        for relpath in to_remove:
+            path = os.path.join(self.build_root, relpath)
+            if os.path.isdir(path):
+                safe_rmtree(path)
+            else:
+                safe_delete(path)
+            # `safe_rmtree` ignores errors, so make sure nothing leaks into the next test.
+            if os.path.lexists(path):
+                raise OSError(f"Failed to remove `{relpath}` while resetting the build root.")
+        self._invalidate_for(*to_remove, *removed_paths)
+        self.set_options([], env_inherit=env_inherit)
+
     def make_snapshot(self, files: Mapping[str, str | bytes]) -> Snapshot:
         """Makes a snapshot from a map of file name to file content.
 
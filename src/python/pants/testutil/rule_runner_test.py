@@ -0,0 +1,36 @@
+# Copyright 2023 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+
+from pants.build_graph.address import Address
+from pants.core.target_types import GenericTarget
+from pants.engine.fs import PathGlobs, Snapshot
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+
+
+def test_reset_workspace() -> None:
+    rule_runner = RuleRunner(
+        rules=[QueryRule(Snapshot, [PathGlobs])],
+        target_types=[GenericTarget],
+    )
+    rule_runner.write_files({"BUILD": "target(name='old')", "src/a/f.txt": "old"})
+    rule_runner.create_dir("empty/nested")
+    snapshot = rule_runner.request(Snapshot, [PathGlobs(["**"])])
+    assert "src/a/f.txt" in snapshot.files
+    assert "empty/nested" in snapshot.dirs
+    assert rule_runner.get_target(Address("", target_name="old")) is not None
+
+    rule_runner.reset_workspace()
+
+    assert os.path.isdir(rule_runner.pants_workdir)
+    assert not os.path.exists(os.path.join(rule_runner.build_root, "src"))
+    assert not os.path.exists(os.path.join(rule_runner.build_root, "empty"))
+
+    rule_runner.write_files({"BUILD": "target(name='new')", "src/b/g.txt": "new"})
+    snapshot = rule_runner.request(Snapshot, [PathGlobs(["**"])])
+    assert snapshot.files == ("BUILD", "src/b/g.txt")
+    assert snapshot.dirs == ("src", "src/b")
+    assert rule_runner.get_target(Address("", target_name="new")) is not None